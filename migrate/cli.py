@@ -0,0 +1,145 @@
+import argparse
+import importlib
+import sys
+
+# Subcommand -> (module, function, sanity check in the same module, description).
+# Stage modules pull in neo4j, falkordb and pandas, so they are only imported once their stage runs.
+# Checks receive the value returned by their stage (the export folder for export).
+STAGES = {
+    "export": (
+        "migrate.export_from_neo4j",
+        "main",
+        "check_export_output",
+        "Stage - Export from Neo4j",
+    ),
+    "transform": ("migrate.transform", "main", None, "Stage - Transform Exported Data"),
+    "import": (
+        "migrate.create_falkordb_graph",
+        "main",
+        "check_falkor_graph_created",
+        "Stage - Create Falkor Graph",
+    ),
+    "verify": ("migrate.compare_graphs", "main", None, "Stage - Compare Graphs"),
+    "clean": ("migrate.clean", "main", None, "Stage - Clean Falkor Graph"),
+    "plan": (
+        "migrate.schema",
+        "print_plan",
+        None,
+        "Print the compiled transform plan",
+    ),
+}
+PIPELINE = ["export", "transform", "import", "verify", "clean"]
+# Stages taking --path; export and import use the folders mounted into Neo4j and FalkorDB
+PATH_STAGES = {"transform"}
+# Options used when a stage runs on its own as a subcommand
+COMMAND_OPTIONS = {"export": {"interactive": False}}
+
+
+def load_stage(name):
+    module_name, func_name, _, _ = STAGES[name]
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def load_check(name):
+    module_name, _, check_name, _ = STAGES[name]
+    if check_name is None:
+        return None
+    return getattr(importlib.import_module(module_name), check_name)
+
+
+def call_stage(name, path=None, **options):
+    if name in PATH_STAGES and path:
+        options["path"] = path
+    return load_stage(name)(**options)
+
+
+def reset_environment():
+    from utils.reset_graphs_and_exported_data import main as reset
+
+    reset()
+
+
+# Helper to confirm continuation
+def confirm_or_exit():
+    proceed = input("Continue to next stage? [Y/n]: ").strip().lower()
+    if proceed not in ("", "y", "yes"):
+        print("Aborting pipeline.")
+        sys.exit(0)
+
+
+# Run a script stage with optional check, with error handling and environment reset
+def run_stage(name, func, check=None):
+    print(f"\n--- Running {name} ---")
+    try:
+        result = func()
+        confirm_or_exit()
+        if check:
+            check(result)
+            confirm_or_exit()
+        return result
+    except Exception as e:
+        print(f"❌ Error during stage '{name}': {e}")
+        print("⚠️  Running reset_environment to clean up...")
+        reset_environment()
+        print("Environment reset. Exiting.")
+        sys.exit(1)
+
+
+# Run a single stage without prompts, e.g. as a scheduled job
+def run_command(name, path=None, check=False):
+    try:
+        result = call_stage(name, path, **COMMAND_OPTIONS.get(name, {}))
+        stage_check = load_check(name)
+        if check and stage_check:
+            stage_check(result)
+    except Exception as e:
+        print(f"❌ Error during stage '{name}': {e}")
+        sys.exit(1)
+
+
+# The folder chosen during export is passed on to the transform stage
+def run_pipeline():
+    path = None
+    for name in PIPELINE:
+        _, _, check, description = STAGES[name]
+        stage_check = (lambda result: load_check(name)(result)) if check else None
+        result = run_stage(description, lambda: call_stage(name, path), stage_check)
+        if name == "export":
+            path = result
+    print("\n ✅✅ Migration pipeline completed successfully")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="migrate",
+        description="Migrate a graph from Neo4j to FalkorDB. Without a command, runs the full interactive pipeline.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    for name, (_, _, check, description) in STAGES.items():
+        subparser = subparsers.add_parser(name, help=description)
+        if name in PATH_STAGES:
+            subparser.add_argument(
+                "--path",
+                help="Folder of the exported CSVs, relative to the project root (default: NEO4J_DATA_FOLDER)",
+            )
+        if check:
+            subparser.add_argument(
+                "--check",
+                action="store_true",
+                help="Run the stage sanity check afterwards",
+            )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        run_pipeline()
+    else:
+        run_command(
+            args.command, getattr(args, "path", None), getattr(args, "check", False)
+        )
+
+
+if __name__ == "__main__":
+    main()
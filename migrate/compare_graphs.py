@@ -1,8 +1,8 @@
 import os
-import pandas as pd
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
 from falkordb import FalkorDB
+from migrate.transform import normalize_driver_rows
 
 load_dotenv()
 FALKOR_DB_HOST = os.getenv("FALKOR_DB_HOST", "localhost")
@@ -23,7 +23,7 @@ comparison_queries = {
     "created_rels": {
         "neo4j": (
             "MATCH (u:User)-[r:CREATED]->(p:Post) "
-            "RETURN elementId(r), datetime(r.timestamp).epochMillis ORDER BY elementId(r)"
+            "RETURN elementId(r), r.timestamp ORDER BY elementId(r)"
         ),
         "falkordb": (
             "MATCH (u:User)-[r:CREATED]->(p:Post) "
@@ -33,15 +33,23 @@ comparison_queries = {
     "friends_with_rels": {
         "neo4j": (
             "MATCH (u1:User)-[r:FRIENDS_WITH]->(u2:User) "
-            "RETURN elementId(r), datetime({date: r.since}).epochMillis ORDER BY elementId(r)"
+            "RETURN elementId(r), r.since ORDER BY elementId(r)"
         ),
         "falkordb": (
             "MATCH (u1:User)-[r:FRIENDS_WITH]->(u2:User) "
-            "RETURN r.element_id, toInteger(r.since) ORDER BY r.element_id"
+            "RETURN r.element_id, r.since ORDER BY r.element_id"
         ),
     },
 }
 
+# Exported CSV whose transform plan normalizes the Neo4j side of each comparison
+comparison_files = {
+    "user_sample": "users.csv",
+    "post_sample": "posts.csv",
+    "created_rels": "created.csv",
+    "friends_with_rels": "friends_with.csv",
+}
+
 
 def query_neo4j(query):
     driver = GraphDatabase.driver(
@@ -61,21 +69,7 @@ def query_falkordb(query):
 
 def compare_results(name, neo4j_result, falkordb_result):
     def normalize_neo(rows):
-        normalized = []
-        for row in rows:
-            values = list(row.values())
-            for i, v in enumerate(values):
-                if isinstance(v, pd.Timestamp) or isinstance(v, str) and "T" in v:
-                    try:
-                        values[i] = int(
-                            pd.to_datetime(v, errors="coerce").timestamp() * 1_000_000
-                        )
-                    except Exception:
-                        pass
-                elif pd.isna(v):
-                    values[i] = None
-            normalized.append(values)
-        return sorted(normalized)
+        return sorted(normalize_driver_rows(rows, comparison_files.get(name)))
 
     def normalize_falkor(rows):
         return sorted(rows)
@@ -2,6 +2,12 @@ import csv
 import os
 from dotenv import load_dotenv
 from falkordb import FalkorDB
+from migrate.schema import (
+    PLAN,
+    cypher_properties,
+    resolve_data_folder,
+    transformed_filename,
+)
 
 load_dotenv()
 FALKOR_DB_HOST = os.getenv("FALKOR_DB_HOST", "localhost")
@@ -11,12 +17,21 @@ FALKOR_DB_GRAPH_NAME = os.getenv("FALKOR_DB_GRAPH_NAME", "SocialGraph")
 FALKOR_DB_DATA_FOLDER = os.getenv("FALKOR_DB_DATA_FOLDER", "import/neo4j_data/")
 
 
-def create_constraints_from_csv(graph):
-    constraints_path = os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__), "..", FALKOR_DB_DATA_FOLDER, "constraints.csv"
+# Importing the raw export would turn every ISO date into null through toInteger()
+def check_transformed_files(data_folder):
+    missing = [
+        transformed_filename(f)
+        for f in PLAN
+        if not os.path.exists(os.path.join(data_folder, transformed_filename(f)))
+    ]
+    if missing:
+        raise FileNotFoundError(
+            f"Transformed files missing in {data_folder}: {missing}. Run the transform stage first."
         )
-    )
+
+
+def create_constraints_from_csv(graph, data_folder):
+    constraints_path = os.path.join(data_folder, "constraints.csv")
     with open(constraints_path, newline="") as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
@@ -32,7 +47,7 @@ def create_constraints_from_csv(graph):
 
 def load_csv_and_create(graph, filename, create_clause, label_desc):
     result = graph.query(
-        f'LOAD CSV WITH HEADERS FROM "{FALKOR_DB_IMPORT_DIR}/{filename}" AS row '
+        f'LOAD CSV WITH HEADERS FROM "{FALKOR_DB_IMPORT_DIR}/{transformed_filename(filename)}" AS row '
         f"{create_clause}"
     )
     print(
@@ -40,38 +55,53 @@ def load_csv_and_create(graph, filename, create_clause, label_desc):
     )
 
 
+# Sanity check on the Falkor grpah after creation
+def check_falkor_graph_created(_path=None):
+    client = FalkorDB(host=FALKOR_DB_HOST, port=FALKOR_DB_PORT)
+    graph = client.select_graph(FALKOR_DB_GRAPH_NAME)
+    result = graph.query("MATCH (n) RETURN count(n)")
+    count = result.result_set[0][0]
+    if count < 1:
+        raise ValueError("Falkordb graph creation check failed: no nodes found.")
+    print(f"Falkordb graph node count: {count}")
+
+
+# LOAD CSV reads from FalkorDB's import directory, FALKOR_DB_DATA_FOLDER is its local mount
 def main():
+    data_folder = resolve_data_folder(FALKOR_DB_DATA_FOLDER)
+    check_transformed_files(data_folder)
+
     client = FalkorDB(host=FALKOR_DB_HOST, port=FALKOR_DB_PORT)
     graph = client.select_graph(FALKOR_DB_GRAPH_NAME)
 
     load_csv_and_create(
         graph,
         "users.csv",
-        "CREATE (:User {element_id: row.element_id, name: row.name, age: toInteger(row.age), city: row.city, email: row.email})",
+        f"CREATE (:User {{{cypher_properties('users.csv')}}})",
         "Users",
     )
     load_csv_and_create(
         graph,
         "posts.csv",
-        "CREATE (:Post {element_id: row.element_id, name: row.name, likes: toInteger(row.likes), category: row.category, image_url: row.image_url})",
+        f"CREATE (:Post {{{cypher_properties('posts.csv')}}})",
         "Posts",
     )
     load_csv_and_create(
         graph,
         "friends_with.csv",
         "MATCH (u1:User {element_id: row.start_id}), (u2:User {element_id: row.end_id}) "
-        "CREATE (u1)-[:FRIENDS_WITH {since: row.since, element_id: row.element_id}]->(u2)",
+        f"CREATE (u1)-[:FRIENDS_WITH {{{cypher_properties('friends_with.csv')}}}]->(u2)",
         "FRIENDS_WITH relationships",
     )
     load_csv_and_create(
         graph,
         "created.csv",
         "MATCH (u:User {element_id: row.start_id}), (p:Post {element_id: row.end_id}) "
-        "CREATE (u)-[:CREATED {timestamp: toInteger(row.timestamp), element_id: row.element_id}]->(p)",
+        f"CREATE (u)-[:CREATED {{{cypher_properties('created.csv')}}}]->(p)",
         "CREATED relationships",
     )
 
-    create_constraints_from_csv(graph)
+    create_constraints_from_csv(graph, data_folder)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,8 @@
 import csv
 import os
-import pandas as pd
-import time
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
+from migrate.schema import resolve_data_folder
 
 load_dotenv()
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
@@ -12,10 +11,17 @@ NEO4J_CREDS_PASSWORD = os.getenv("NEO4J_CREDS_PASSWORD", "test1234")
 NEO4J_MOUNTED_DIR = os.getenv("NEO4J_MOUNTED_DIR", "/import/neo4j_data")
 NEO4J_DATA_FOLDER = os.getenv("NEO4J_DATA_FOLDER", "data/neo4j_data")
 
+EXPECTED_FILES = [
+    "users.csv",
+    "posts.csv",
+    "friends_with.csv",
+    "created.csv",
+    "constraints.csv",
+]
+
 
 def get_export_path():
-    cwd = os.getcwd()
-    default_path = os.path.join(cwd, NEO4J_DATA_FOLDER)
+    default_path = resolve_data_folder(NEO4J_DATA_FOLDER)
     response = (
         input(f"Use default local export path '{default_path}'? [Y/n]: ")
         .strip()
@@ -29,43 +35,18 @@ def get_export_path():
     if s3 in ("y", "yes"):
         raise NotImplementedError("S3 export is not yet implemented.")
 
-    custom_path = input("Enter custom local export path: ").strip()
+    custom_path = resolve_data_folder(input("Enter custom local export path: ").strip())
     os.makedirs(custom_path, exist_ok=True)
     return custom_path
 
 
-def convert_created_timestamp_to_epoch(path):
-    file_path = os.path.join(path, "created.csv")
-
-    for _ in range(10):
-        if os.path.exists(file_path):
-            break
-        time.sleep(0.5)
-    else:
-        raise FileNotFoundError(f"File not found after waiting: {file_path}")
-
-    df = pd.read_csv(file_path)
-    df["timestamp"] = (
-        pd.to_datetime(df["timestamp"], errors="coerce").astype("int64") // 1_000_000
-    )
-    df.to_csv(file_path, index=False)
-
-
-def convert_firends_with_since_to_epoch(path):
-    file_path = os.path.join(path, "friends_with.csv")
-
-    for _ in range(10):
-        if os.path.exists(file_path):
-            break
-        time.sleep(0.5)
-    else:
-        raise FileNotFoundError(f"File not found after waiting: {file_path}")
-
-    df = pd.read_csv(file_path)
-    df["since"] = (
-        pd.to_datetime(df["since"], errors="coerce").astype("int64") // 1_000_000
-    )
-    df.to_csv(file_path, index=False)
+# Sanity check on the exported csv files in data/neo4j_data
+def check_export_output(path=NEO4J_DATA_FOLDER):
+    path = resolve_data_folder(path)
+    missing = [f for f in EXPECTED_FILES if not os.path.exists(f"{path}/{f}")]
+    if missing:
+        raise ValueError(f"Export check failed: missing files {missing}")
+    print("Exported files present.")
 
 
 def get_neo4j_credentials():
@@ -81,9 +62,16 @@ def get_neo4j_credentials():
     return uri, user, password
 
 
-def main():
-    uri, user, password = get_neo4j_credentials()
-    export_path = get_export_path()
+# Without interactive prompts (scheduled runs) the credentials and folder come from the environment.
+# APOC writes the node and relationship CSVs to NEO4J_MOUNTED_DIR on the Neo4j server,
+# which has to be mounted on the returned folder.
+def main(interactive=True):
+    if interactive:
+        uri, user, password = get_neo4j_credentials()
+        export_path = get_export_path()
+    else:
+        uri, user, password = NEO4J_URI, NEO4J_CREDS_USERNAME, NEO4J_CREDS_PASSWORD
+        export_path = resolve_data_folder(NEO4J_DATA_FOLDER)
     os.makedirs(export_path, exist_ok=True)
 
     driver = GraphDatabase.driver(uri, auth=(user, password))
@@ -129,10 +117,6 @@ def main():
         result.consume()
         print(f"[✓] Exported to: {NEO4J_DATA_FOLDER}/created.csv")
 
-        # Transformations
-        convert_created_timestamp_to_epoch(export_path)
-        convert_firends_with_since_to_epoch(export_path)
-
         # Constraints
         constraints_result = session.run("SHOW CONSTRAINTS")
         headers = [key for key in constraints_result.keys()]
@@ -145,6 +129,7 @@ def main():
             writer.writerows(rows)
 
     print(f"[✓] Export complete. Files written to: {export_path}")
+    return export_path
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import os
+from collections import namedtuple
+
+# Property types of every exported CSV, per column.
+# Supported types: string, integer, float, boolean, date, datetime (local or zoned),
+# duration, point, bytes and list<string|integer|float|boolean>.
+# start_id/end_id only serve to MATCH relationship endpoints and are left untouched.
+SCHEMA = {
+    "users.csv": {
+        "element_id": "string",
+        "name": "string",
+        "age": "integer",
+        "city": "string",
+        "email": "string",
+    },
+    "posts.csv": {
+        "element_id": "string",
+        "name": "string",
+        "likes": "integer",
+        "category": "string",
+        "image_url": "string",
+    },
+    "friends_with.csv": {"element_id": "string", "since": "date"},
+    "created.csv": {"element_id": "string", "timestamp": "datetime"},
+}
+
+# Lists are written as "[a|b]" and "[]" stays an empty list, distinct from an empty (null) cell.
+# Inside items "%" and "|" are percent-escaped and an empty string is written as "%00".
+LIST_SEPARATOR = "|"
+LIST_ESCAPES = [("%", "%25"), (LIST_SEPARATOR, "%7C")]
+LIST_EMPTY_ITEM = "%00"
+
+# LOAD CSV expression that turns a transformed cell into the stored property
+CYPHER_TEMPLATES = {
+    "string": "{ref}",
+    "integer": "toInteger({ref})",
+    "float": "toFloat({ref})",
+    "boolean": "toBoolean({ref})",
+    "date": "toInteger({ref})",
+    "datetime": "toInteger({ref})",
+    "duration": "toInteger({ref})",
+    "point": "point({{latitude: toFloat(split({ref}, ',')[0]), longitude: toFloat(split({ref}, ',')[1])}})",
+    "bytes": "{ref}",
+}
+LIST_ELEMENT_TEMPLATES = {
+    "string": "{item}",
+    "integer": "toInteger({item})",
+    "float": "toFloat({item})",
+    "boolean": "toBoolean({item})",
+}
+
+# One column of the compiled plan; element_type is only set for lists
+ColumnSpec = namedtuple("ColumnSpec", ["column", "type_name", "element_type", "cypher"])
+
+
+def list_cypher(element_type):
+    # Undo the escapes in reverse order, "%25" last so it cannot produce new escapes
+    item = f"replace(x, '{LIST_EMPTY_ITEM}', '')"
+    for char, escaped in reversed(LIST_ESCAPES):
+        item = f"replace({item}, '{escaped}', '{char}')"
+    item = LIST_ELEMENT_TEMPLATES[element_type].format(item=item)
+    items = f"split(substring({{ref}}, 1, size({{ref}}) - 2), '{LIST_SEPARATOR}')"
+    return f"CASE WHEN {{ref}} = '[]' THEN [] ELSE [x IN {items} | {item}] END"
+
+
+def compile_column(column, type_name):
+    type_name = type_name.strip().lower()
+    if type_name.startswith("list<") and type_name.endswith(">"):
+        element_type = type_name[5:-1].strip()
+        if element_type not in LIST_ELEMENT_TEMPLATES:
+            raise ValueError(
+                f"Unsupported list element type '{element_type}' for {column}"
+            )
+        return ColumnSpec(column, "list", element_type, list_cypher(element_type))
+    if type_name not in CYPHER_TEMPLATES:
+        raise ValueError(f"Unsupported property type '{type_name}' for {column}")
+    return ColumnSpec(column, type_name, None, CYPHER_TEMPLATES[type_name])
+
+
+# Compile the schema once into a per-file list of column specs
+def compile_plan(schema):
+    return {
+        filename: [
+            compile_column(column, type_name) for column, type_name in columns.items()
+        ]
+        for filename, columns in schema.items()
+    }
+
+
+PLAN = compile_plan(SCHEMA)
+
+
+# Property map for a LOAD CSV CREATE clause, e.g. "name: ..., age: toInteger(row.age)"
+def cypher_properties(filename, plan=PLAN, row="row"):
+    properties = []
+    for spec in plan[filename]:
+        ref = f"{row}.{spec.column}"
+        expr = spec.cypher.format(ref=ref)
+        # Empty CSV cells are Neo4j nulls, so the property is not set at all.
+        # The export writes empty strings as empty cells too, so they cannot be told apart from nulls.
+        properties.append(
+            f"{spec.column}: CASE WHEN {ref} IS NULL OR {ref} = '' THEN NULL ELSE {expr} END"
+        )
+    return ", ".join(properties)
+
+
+# The transform stage never overwrites the raw export, it writes e.g. users.falkordb.csv next to it
+def transformed_filename(filename):
+    return filename.replace(".csv", ".falkordb.csv")
+
+
+# Every stage resolves relative data folders from the root of the project, not the working directory
+def resolve_data_folder(path):
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", path))
+
+
+def print_plan(plan=PLAN):
+    for filename, specs in plan.items():
+        print(f"{filename}:")
+        for spec in specs:
+            type_name = (
+                f"list<{spec.element_type}>" if spec.element_type else spec.type_name
+            )
+            expr = spec.cypher.format(ref=f"row.{spec.column}")
+            print(f"  {spec.column} ({type_name}) -> {expr}")
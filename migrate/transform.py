@@ -0,0 +1,317 @@
+import base64
+import json
+import os
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+from migrate.schema import (
+    LIST_EMPTY_ITEM,
+    LIST_ESCAPES,
+    LIST_SEPARATOR,
+    PLAN,
+    resolve_data_folder,
+    transformed_filename,
+)
+
+load_dotenv()
+NEO4J_DATA_FOLDER = os.getenv("NEO4J_DATA_FOLDER", "data/neo4j_data")
+
+EPOCH_DATETIME = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# "<date>[T<time>][Z|+hh:mm|-hh:mm]", the zone id is removed beforehand
+TEMPORAL_PATTERN = (
+    r"^(?P<local>[^T]+(?:T[\d:.]+)?)"
+    r"(?:Z|(?P<sign>[+-])(?P<hours>\d{2}):?(?P<minutes>\d{2}))?$"
+)
+MILLIS_PER_DAY = 86_400_000
+# Average Gregorian month, used to express the month part of Neo4j durations
+MILLIS_PER_MONTH = 2_629_746_000
+DURATION_PATTERN = (
+    r"^P(?:(?P<years>-?[\d.]+)Y)?(?:(?P<months>-?[\d.]+)M)?"
+    r"(?:(?P<weeks>-?[\d.]+)W)?(?:(?P<days>-?[\d.]+)D)?"
+    r"(?:T(?:(?P<hours>-?[\d.]+)H)?(?:(?P<minutes>-?[\d.]+)M)?(?:(?P<seconds>-?[\d.]+)S)?)?$"
+)
+DURATION_UNIT_MILLIS = {
+    "years": 12 * MILLIS_PER_MONTH,
+    "months": MILLIS_PER_MONTH,
+    "weeks": 7 * MILLIS_PER_DAY,
+    "days": MILLIS_PER_DAY,
+    "hours": 3_600_000,
+    "minutes": 60_000,
+    "seconds": 1_000,
+}
+NUMBER_PATTERN = r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+# FalkorDB points are geographic only: WGS-84 2D and 3D
+WGS84_SRIDS = {4326, 4979}
+
+# Converters of one plan column:
+# - export: vectorized conversion of a raw CSV column into the value written for FalkorDB
+# - driver: conversion of the Neo4j driver values of the column into the value FalkorDB returns
+ColumnConverter = namedtuple("ColumnConverter", ["column", "export", "driver"])
+
+
+# A non-empty cell that does not convert is an error, it must not silently become null
+def check_converted(values, converted, type_name):
+    invalid = values.notna() & converted.isna()
+    if invalid.any():
+        raise ValueError(
+            f"Invalid {type_name} in column {values.name}: {values[invalid].iloc[0]!r}"
+        )
+    return converted
+
+
+# === Export converters: raw CSV text -> value written for FalkorDB ===
+def to_string(values):
+    return values.astype("string")
+
+
+# Parsed without going through float64, so integers above 2^53 keep every digit.
+# Fractional values are rejected rather than truncated: the column is not an integer column.
+def to_integer(values):
+    text = values.astype("string").str.replace(r"\.0*$", "", regex=True)
+    numbers = pd.to_numeric(text, errors="coerce", dtype_backend="numpy_nullable")
+    check_converted(values, numbers, "integer")
+    fractional = numbers.notna() & (numbers != numbers.round())
+    if fractional.any():
+        raise ValueError(
+            f"Fractional integer in column {values.name}: {values[fractional].iloc[0]!r}"
+        )
+    return numbers.astype("Int64")
+
+
+def to_float(values):
+    numbers = pd.to_numeric(values, errors="coerce", dtype_backend="numpy_nullable")
+    return check_converted(values, numbers, "float").astype("Float64")
+
+
+def to_boolean(values):
+    text = values.astype("string").str.lower()
+    return check_converted(values, text.where(text.isin(["true", "false"])), "boolean")
+
+
+# Dates, local datetimes and zoned datetimes all become UNIX epoch milliseconds (UTC).
+# Parsed as numpy datetime64[ms], which covers years 0001-9999 unlike pandas' nanosecond timestamps.
+def to_epoch_millis(values):
+    # Zone ids such as "[Europe/Berlin]" follow the offset and add nothing to the instant
+    text = values.astype("string").str.replace(r"\[[^\]]*\]$", "", regex=True)
+    parts = text.str.extract(TEMPORAL_PATTERN)
+    check_converted(values, parts["local"], "date or datetime")
+    local = parts["local"].dropna()
+    try:
+        millis = local.to_numpy(dtype=str).astype("datetime64[ms]").astype(np.int64)
+    except ValueError as e:
+        raise ValueError(f"Invalid date or datetime in column {values.name}: {e}")
+    # Local datetimes carry no offset and are read as UTC, like Neo4j's datetime() does
+    sign = parts["sign"].map({"+": 1, "-": -1}).fillna(0)
+    offset_minutes = sign * (
+        pd.to_numeric(parts["hours"]).fillna(0) * 60
+        + pd.to_numeric(parts["minutes"]).fillna(0)
+    )
+    instants = pd.Series(millis, index=local.index, dtype="Int64")
+    return (instants.reindex(values.index) - offset_minutes * 60_000).astype("Int64")
+
+
+# ISO 8601 durations (e.g. P1M2DT3H) become milliseconds
+def to_duration_millis(values):
+    parts = values.astype("string").str.extract(DURATION_PATTERN)
+    millis = sum(
+        pd.to_numeric(parts[unit], errors="coerce").fillna(0) * factor
+        for unit, factor in DURATION_UNIT_MILLIS.items()
+    )
+    millis = millis.mask(parts.isna().all(axis=1))
+    return check_converted(values, millis, "duration").round().astype("Int64")
+
+
+# WGS-84 points ({"crs":"wgs-84","latitude":..,"longitude":..}) become "latitude,longitude"
+def to_point(values):
+    text = values.astype("string")
+    latitude = text.str.extract(rf'"latitude"\s*:\s*{NUMBER_PATTERN}', expand=False)
+    longitude = text.str.extract(rf'"longitude"\s*:\s*{NUMBER_PATTERN}', expand=False)
+    unsupported = text.notna() & (latitude.isna() | longitude.isna())
+    if unsupported.any():
+        raise ValueError(
+            f"Only WGS-84 points can be migrated to FalkorDB, got {text[unsupported].iloc[0]}"
+        )
+    return latitude + "," + longitude
+
+
+# Byte arrays are kept as base64 text, FalkorDB has no binary property type
+def to_bytes(values):
+    def encode(text):
+        if text.startswith("["):
+            return base64.b64encode(bytes(json.loads(text))).decode("ascii")
+        return text
+
+    text = values.astype("string")
+    return text.dropna().map(encode).reindex(text.index).astype("string")
+
+
+def escape_list_item(item):
+    text = str(item).lower() if isinstance(item, bool) else str(item)
+    if text == "":
+        return LIST_EMPTY_ITEM
+    for char, escaped in LIST_ESCAPES:
+        text = text.replace(char, escaped)
+    return text
+
+
+# JSON lists (["a","b"]) become "[a|b]", see migrate/schema.py for the escaping
+def to_list(values):
+    def join(text):
+        items = json.loads(text) if text.startswith("[") else [text]
+        return "[" + LIST_SEPARATOR.join(escape_list_item(item) for item in items) + "]"
+
+    text = values.astype("string")
+    return text.dropna().map(join).reindex(text.index).astype("string")
+
+
+# === Driver decoders: Neo4j driver values -> value returned by FalkorDB ===
+# Chosen per column type when the plan is compiled, so no value is inspected for its type.
+def keep(values):
+    return values
+
+
+def driver_integer(values):
+    return values.astype("Int64")
+
+
+def driver_float(values):
+    return values.astype("Float64")
+
+
+# neo4j.time Date, DateTime and LocalDateTime; local values are read as UTC.
+# Computed per value with Python datetimes, which cover years 0001-9999.
+def driver_epoch_millis(values):
+    def millis(value):
+        native = value.to_native()
+        if not isinstance(native, datetime):
+            native = datetime(native.year, native.month, native.day)
+        if native.tzinfo is None:
+            native = native.replace(tzinfo=timezone.utc)
+        return (native - EPOCH_DATETIME) // timedelta(milliseconds=1)
+
+    return values.map(millis, na_action="ignore").astype("Int64")
+
+
+def driver_duration_millis(values):
+    def millis(duration):
+        return (
+            duration.months * MILLIS_PER_MONTH
+            + duration.days * MILLIS_PER_DAY
+            + duration.seconds * 1_000
+            + round(duration.nanoseconds / 1_000_000)
+        )
+
+    return values.map(millis, na_action="ignore").astype("Int64")
+
+
+def driver_point(values):
+    def point(value):
+        if value.srid not in WGS84_SRIDS:
+            raise ValueError(
+                f"Only WGS-84 points can be migrated to FalkorDB, got {value!r}"
+            )
+        return {"latitude": value.latitude, "longitude": value.longitude}
+
+    return values.map(point, na_action="ignore")
+
+
+def driver_bytes(values):
+    return values.map(
+        lambda value: base64.b64encode(bytes(value)).decode("ascii"),
+        na_action="ignore",
+    )
+
+
+# type name -> (export converter, driver decoder)
+TYPE_CONVERTERS = {
+    "string": (to_string, keep),
+    "integer": (to_integer, driver_integer),
+    "float": (to_float, driver_float),
+    "boolean": (to_boolean, keep),
+    "date": (to_epoch_millis, driver_epoch_millis),
+    "datetime": (to_epoch_millis, driver_epoch_millis),
+    "duration": (to_duration_millis, driver_duration_millis),
+    "point": (to_point, driver_point),
+    "bytes": (to_bytes, driver_bytes),
+    "list": (to_list, keep),
+}
+
+
+def compile_converter(spec):
+    return ColumnConverter(spec.column, *TYPE_CONVERTERS[spec.type_name])
+
+
+# Pair every column of a compiled plan with its converters, once per plan
+def compile_converters(plan):
+    return {
+        filename: [compile_converter(spec) for spec in specs]
+        for filename, specs in plan.items()
+    }
+
+
+CONVERTERS = compile_converters(PLAN)
+
+
+def apply_converters(df, converters):
+    for converter in converters:
+        if converter.column in df.columns:
+            df[converter.column] = converter.export(df[converter.column])
+    return df
+
+
+def wait_for_file(file_path):
+    for _ in range(10):
+        if os.path.exists(file_path):
+            return
+        time.sleep(0.5)
+    raise FileNotFoundError(f"File not found after waiting: {file_path}")
+
+
+def transform_exported_csv(path, filename, converters=CONVERTERS):
+    file_path = os.path.join(path, filename)
+    wait_for_file(file_path)
+
+    # Read everything as text so no type is inferred before the plan is applied.
+    # Empty cells are read as null, the export does not distinguish them from empty strings.
+    df = pd.read_csv(file_path, dtype=str, keep_default_na=False, na_values=[""])
+    apply_converters(df, converters[filename])
+    # The raw export is left untouched, so the stage can be rerun safely
+    transformed_path = os.path.join(path, transformed_filename(filename))
+    df.to_csv(transformed_path, index=False)
+    return transformed_path
+
+
+def transform_exported_data(path, converters=CONVERTERS):
+    for filename in converters:
+        transformed_path = transform_exported_csv(path, filename, converters)
+        print(f"[✓] Transformed: {transformed_path}")
+
+
+# Normalize Neo4j query rows (dicts) into the values FalkorDB returns, column by column.
+# Result keys such as "u.age" are matched to the schema column "age";
+# columns without a schema entry are compared as returned.
+def normalize_driver_rows(rows, filename, converters=CONVERTERS):
+    if not rows:
+        return []
+    by_column = {
+        converter.column: converter for converter in converters.get(filename, [])
+    }
+    df = pd.DataFrame(rows, dtype=object)
+    for key in df.columns:
+        converter = by_column.get(key.split(".")[-1])
+        if converter is None:
+            continue
+        df[key] = converter.driver(df[key])
+    df = df.astype(object)
+    return df.where(df.notna(), None).values.tolist()
+
+
+def main(path=NEO4J_DATA_FOLDER):
+    transform_exported_data(resolve_data_folder(path))
+
+
+if __name__ == "__main__":
+    main()
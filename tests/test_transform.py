@@ -0,0 +1,263 @@
+import datetime
+import os
+
+import pandas as pd
+import pytest
+import pytz
+from neo4j.spatial import CartesianPoint, WGS84Point
+from neo4j.time import Date, DateTime, Duration
+
+from migrate.create_falkordb_graph import check_transformed_files
+from migrate.schema import (
+    LIST_EMPTY_ITEM,
+    LIST_ESCAPES,
+    LIST_SEPARATOR,
+    PLAN,
+    compile_column,
+    compile_plan,
+    cypher_properties,
+    resolve_data_folder,
+    transformed_filename,
+)
+from migrate.transform import (
+    compile_converters,
+    normalize_driver_rows,
+    to_boolean,
+    to_bytes,
+    to_duration_millis,
+    to_epoch_millis,
+    to_float,
+    to_integer,
+    to_list,
+    to_point,
+    to_string,
+    transform_exported_data,
+)
+
+BERLIN = pytz.timezone("Europe/Berlin")
+ALL_TYPES = {
+    "s": "string",
+    "i": "integer",
+    "f": "float",
+    "b": "boolean",
+    "d": "date",
+    "dt": "datetime",
+    "du": "duration",
+    "p": "point",
+    "by": "bytes",
+    "ls": "list<string>",
+    "li": "list<integer>",
+}
+CONVERTERS = compile_converters(compile_plan({"all.csv": ALL_TYPES}))
+
+
+def export(converter, *cells):
+    return converter(pd.Series(cells, dtype=object)).tolist()
+
+
+def driver(column, *values):
+    rows = [{f"n.{column}": value} for value in values]
+    return [row[0] for row in normalize_driver_rows(rows, "all.csv", CONVERTERS)]
+
+
+# Python mirror of the LOAD CSV list expression built in migrate/schema.py
+def load_list(cell, cast=str):
+    if cell == "[]":
+        return []
+    items = []
+    for item in cell[1:-1].split(LIST_SEPARATOR):
+        item = item.replace(LIST_EMPTY_ITEM, "")
+        for char, escaped in reversed(LIST_ESCAPES):
+            item = item.replace(escaped, char)
+        items.append(cast(item))
+    return items
+
+
+def test_scalar_converters_match_driver_decoders():
+    assert export(to_string, "Alice") == driver("s", "Alice") == ["Alice"]
+    assert export(to_integer, "30") == driver("i", 30) == [30]
+    assert export(to_float, "1.5") == driver("f", 1.5) == [1.5]
+    assert export(to_boolean, "true", "FALSE") == ["true", "false"]
+    assert driver("b", True, False) == [True, False]
+    assert export(to_bytes, "[1,2]", "AQI=") == driver("by", bytearray(b"\x01\x02")) * 2
+
+
+def test_temporal_converters_match_driver_decoders():
+    berlin_noon = DateTime.from_native(
+        BERLIN.localize(datetime.datetime(2023, 5, 1, 12))
+    )
+    assert (
+        export(to_epoch_millis, "2023-05-01T12:00:00+02:00[Europe/Berlin]")
+        == driver("dt", berlin_noon)
+        == [1682935200000]
+    )
+    assert (
+        export(to_epoch_millis, "2022-01-01T00:00:00")
+        == driver("dt", DateTime(2022, 1, 1, 0, 0, 0))
+        == [1640995200000]
+    )
+    assert (
+        export(to_epoch_millis, "2020-01-01")
+        == driver("d", Date(2020, 1, 1))
+        == [1577836800000]
+    )
+    assert (
+        export(to_duration_millis, "P1M2DT3.5S", "PT-1.5S")
+        == driver("du", Duration(months=1, days=2, seconds=3.5), Duration(seconds=-1.5))
+        == [2802549500, -1500]
+    )
+
+
+def test_integers_keep_every_digit_next_to_nulls():
+    big = 2**53 + 1
+    assert export(to_integer, str(big), None, "30.0") == [big, pd.NA, 30]
+    assert driver("i", big, None) == [big, None]
+
+
+def test_dates_outside_the_nanosecond_range():
+    assert (
+        export(to_epoch_millis, "0001-01-01", "9999-12-31")
+        == driver("d", Date(1, 1, 1), Date(9999, 12, 31))
+        == [-62135596800000, 253402214400000]
+    )
+    assert (
+        export(to_epoch_millis, "9999-12-31T23:59:59.999Z")
+        == driver(
+            "dt", DateTime(9999, 12, 31, 23, 59, 59, 999_000_000, tzinfo=pytz.utc)
+        )
+        == [253402300799999]
+    )
+
+
+@pytest.mark.parametrize(
+    "converter, cell",
+    [
+        (to_integer, "1.7"),
+        (to_integer, "12abc"),
+        (to_float, "12abc"),
+        (to_boolean, "yes"),
+        (to_duration_millis, "12abc"),
+        (to_epoch_millis, "12abc"),
+        (to_epoch_millis, "2020-13-01"),
+    ],
+)
+def test_invalid_cells_are_rejected(converter, cell):
+    with pytest.raises(ValueError):
+        export(converter, cell)
+
+
+def test_point_converter_matches_driver_decoder():
+    cell = export(to_point, '{"crs":"wgs-84","latitude":1.5,"longitude":2.5}')
+    assert cell == ["1.5,2.5"]
+    assert driver("p", WGS84Point((2.5, 1.5))) == [{"latitude": 1.5, "longitude": 2.5}]
+
+
+def test_cartesian_points_are_rejected():
+    with pytest.raises(ValueError):
+        export(to_point, '{"crs":"cartesian","x":1.0,"y":2.0}')
+    with pytest.raises(ValueError):
+        driver("p", CartesianPoint((1.0, 2.0)))
+
+
+def test_list_converter_matches_driver_decoder():
+    raw = ['["a","b|c"]', '["5%7C", ""]', "[]", '[""]']
+    expected = [["a", "b|c"], ["5%7C", ""], [], [""]]
+    assert [load_list(cell) for cell in export(to_list, *raw)] == expected
+    assert driver("ls", *expected) == expected
+
+    assert [load_list(cell, int) for cell in export(to_list, "[1,2]", "[]")] == [
+        [1, 2],
+        [],
+    ]
+    assert driver("li", [1, 2], []) == [[1, 2], []]
+
+
+def test_null_cells_stay_null():
+    for converter in (
+        to_string,
+        to_integer,
+        to_float,
+        to_boolean,
+        to_epoch_millis,
+        to_duration_millis,
+        to_point,
+        to_bytes,
+        to_list,
+    ):
+        assert pd.isna(export(converter, None)[0])
+    for column in ALL_TYPES:
+        assert driver(column, None) == [None]
+
+
+def test_list_cypher_distinguishes_empty_lists():
+    cypher = compile_column("tags", "list<integer>").cypher.format(ref="row.tags")
+    assert cypher.startswith("CASE WHEN row.tags = '[]' THEN [] ELSE ")
+    assert (
+        "toInteger(replace(replace(replace(x, '%00', ''), '%7C', '|'), '%25', '%'))"
+        in cypher
+    )
+
+
+def test_cypher_properties_for_schema():
+    assert cypher_properties("friends_with.csv") == (
+        "element_id: CASE WHEN row.element_id IS NULL OR row.element_id = '' "
+        "THEN NULL ELSE row.element_id END, "
+        "since: CASE WHEN row.since IS NULL OR row.since = '' "
+        "THEN NULL ELSE toInteger(row.since) END"
+    )
+    assert cypher_properties("created.csv").endswith(
+        "timestamp: CASE WHEN row.timestamp IS NULL OR row.timestamp = '' "
+        "THEN NULL ELSE toInteger(row.timestamp) END"
+    )
+    users = cypher_properties("users.csv")
+    assert (
+        "age: CASE WHEN row.age IS NULL OR row.age = '' THEN NULL ELSE toInteger(row.age) END"
+        in users
+    )
+    for column in ("element_id", "name", "city", "email"):
+        assert f"{column}: CASE WHEN row.{column} IS NULL" in users
+
+
+def write_raw_export(folder):
+    raw = {
+        "users.csv": 'element_id,name,age,city,email\n"4:a:0","Alice",30,"Paris",\n',
+        "posts.csv": 'element_id,name,likes,category,image_url\n"4:a:1","Hello",,"news","http://img"\n',
+        "friends_with.csv": 'element_id,start_id,end_id,since\n"5:a:2","4:a:0","4:a:0","2020-01-01"\n',
+        "created.csv": 'element_id,start_id,end_id,timestamp\n"5:a:3","4:a:0","4:a:1","2023-05-01T10:00:00Z"\n',
+    }
+    for filename, content in raw.items():
+        (folder / filename).write_text(content)
+    return raw
+
+
+def test_transform_can_be_rerun(tmp_path):
+    raw = write_raw_export(tmp_path)
+    transform_exported_data(tmp_path)
+    first = {f: (tmp_path / transformed_filename(f)).read_text() for f in PLAN}
+    transform_exported_data(tmp_path)
+    second = {f: (tmp_path / transformed_filename(f)).read_text() for f in PLAN}
+
+    assert first == second
+    assert {f: (tmp_path / f).read_text() for f in raw} == raw
+    assert (
+        first["friends_with.csv"].splitlines()[1] == "5:a:2,4:a:0,4:a:0,1577836800000"
+    )
+    assert first["users.csv"].splitlines()[1] == "4:a:0,Alice,30,Paris,"
+    assert first["posts.csv"].splitlines()[1] == "4:a:1,Hello,,news,http://img"
+
+
+def test_import_requires_transformed_files(tmp_path):
+    write_raw_export(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        check_transformed_files(tmp_path)
+    transform_exported_data(tmp_path)
+    check_transformed_files(tmp_path)
+
+
+def test_data_folders_resolve_from_project_root(tmp_path, monkeypatch):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.chdir(tmp_path)
+    assert resolve_data_folder("data/neo4j_data") == os.path.join(
+        root, "data", "neo4j_data"
+    )
+    assert resolve_data_folder(str(tmp_path)) == str(tmp_path)
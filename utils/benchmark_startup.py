@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RUNS = int(os.getenv("BENCHMARK_RUNS", "5"))
+
+# Each run is a fresh interpreter, so the measured time is a cold import of the stage.
+# ru_maxrss is reported in kilobytes on Linux (bytes on macOS).
+MEASURE = """
+import resource, sys, time
+start = time.perf_counter()
+from migrate.cli import load_stage
+for name in sys.argv[1].split(","):
+    load_stage(name)
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(stages):
+    timings, memory = [], []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE, stages],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        memory.append(int(output[1]))
+    return min(timings), max(memory)
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    from migrate.cli import STAGES
+
+    # "all" imports every stage up front, like the pipeline entry point used to
+    targets = list(STAGES) + [",".join(STAGES)]
+    print(f"Startup benchmark (best of {RUNS} cold runs)")
+    print(f"{'command':<12} {'import time (ms)':>18} {'max RSS (MB)':>14}")
+    for stages in targets:
+        seconds, max_rss = measure(stages)
+        label = "all stages" if "," in stages else stages
+        print(f"{label:<12} {seconds * 1000:>18.1f} {max_rss / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -92,6 +92,7 @@ def main():
         "Stage - Reset Environment": (reset_environment, None),
         "Stage - Create Neo4j Graph": (create_neo4j_graph, check_neo4j_node_count),
         "Stage - Export from Neo4j": (export_data_from_neo4j, check_export_output),
+        "Stage - Transform Exported Data": (transform_exported_data, None),
         "Stage - Create Falkordb Graph": (
             create_falkordb_graph,
             check_falkordb_graph_created,
@@ -122,6 +123,7 @@ if __name__ == "__main__":
     from utils.reset_graphs_and_exported_data import main as reset_environment
     from utils.create_neo4j_graph import main as create_neo4j_graph
     from migrate.export_from_neo4j import main as export_data_from_neo4j
+    from migrate.transform import main as transform_exported_data
     from migrate.create_falkordb_graph import main as create_falkordb_graph
     from migrate.compare_graphs import main as compare_graphs
     from migrate.clean import main as clean_falkordb